@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Compare generateDictionary padding in the main process against worker processes.
+
+Usage:
+    python3 benchmarks/parallel_padding.py [-l LENGTH] [-c CHARSET] [-w WORKERS ...]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dictionaryGenerator  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parallel padding in generateDictionary.")
+    parser.add_argument('-l', '--max-length', type=int, default=9, help="Length to pad the words to.")
+    parser.add_argument('-c', '--charset', type=str, default="?d", help="Characters to pad the words.")
+    parser.add_argument('-w', '--workers', type=int, nargs='+', default=[1, 2, 4, os.cpu_count() or 1],
+                        help="Numbers of worker processes to compare.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=os.getcwd()) as tmpdir:
+        wordlist = os.path.join(tmpdir, "words.txt")
+        with open(wordlist, 'w') as f:
+            f.write("ab\ncd\n")
+
+        print(f"CPUs: {os.cpu_count()}")
+        for workers in sorted(set(args.workers)):
+            output = os.path.join(tmpdir, f"output_{workers}.txt")
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                dictionaryGenerator.generateDictionary(wordlist, args.max_length, args.charset,
+                                                       output=output, workers=workers)
+            elapsed = time.perf_counter() - start
+            size = os.path.getsize(output)
+            os.unlink(output)
+            print(f"workers={workers:<3} {elapsed:7.2f}s  {size / elapsed / 2**20:8.1f} MiB/s")
+
+
+if __name__ == "__main__":
+    main()
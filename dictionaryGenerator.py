@@ -1,8 +1,229 @@
 #!/usr/bin/env python3
 
 import argparse
+import functools
 import itertools
+import mmap
+import multiprocessing
+import os
+import shutil
+import stat
+import tempfile
+
+# Size of the output buffer flushed to disk (1 MiB)
+BUFFER_SIZE = 1 << 20
+
+# Size of the newline-aligned chunks read from the input dictionaries (8 MiB)
+CHUNK_SIZE = 8 << 20
+
+# Maximum number of padded words built at once by a single join
+BATCH_ROWS = 1 << 14
+
+# Minimum number of padding combinations of a word to split it across worker processes
+PARALLEL_THRESHOLD = 1 << 16
+
+# Predefined charsets used to pad the words
+PREDEFINED_CHARSETS = {
+    '?l': 'abcdefghijklmnopqrstuvwxyz',  # Lowercase letters
+    '?u': 'ABCDEFGHIJKLMNOPQRSTUVWXYZ',  # Uppercase letters
+    '?d': '0123456789',  # Digits
+    '?h': '0123456789abcdef',  # Hexadecimal (lowercase)
+    '?H': '0123456789ABCDEF',  # Hexadecimal (uppercase)
+    '?s': r'!"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~',  # Special characters
+    '?a': 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~' # Alphanumeric + special characters
+}
+
+# Predefined blacklists used to filter the words
+PREDEFINED_BLACKLISTS = {
+    '?l': 'abcdefghijklmnopqrstuvwxyz',  # Lowercase letters
+    '?u': 'ABCDEFGHIJKLMNOPQRSTUVWXYZ',  # Uppercase letters
+    '?d': '0123456789',  # Digits
+    '?a': 'áéíóúÁÉÍÓÚñÑüÜ',  # Accents
+    '?s': r'!"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~'  # Special characters
+}
+
+# Common character substitutions used by the extended combinatory
+SUBSTITUTIONS = {
+    'a': ['4', '@'],
+    'b': ['8'],
+    'c': ['<', '('],
+    'e': ['3'],
+    'g': ['6', '9'],
+    'i': ['1', '!'],
+    'l': ['1', '|'],
+    'o': ['0'],
+    's': ['5', '$'],
+    't': ['7', '+'],
+    'z': ['2'],
+    # Add more substitutions as needed
+}
+
+# Alignment required by O_DIRECT writes on the output file
+DIRECT_ALIGNMENT = 4096
+
+# Bytes stripped from the words, matching str.strip() on latin-1 decoded lines
+LATIN1_WHITESPACE = bytes(byte for byte in range(256) if chr(byte).isspace())
+
+
+def _build_case_tables():
+    """
+    Build the latin-1 translation tables used to switch the case of letters.
+
+    Returns:
+        tuple: A table mapping every byte to its lowercase form, a table with,
+               for every letter, the XOR mask that toggles it between cases, and
+               the letters whose other case is several latin-1 characters.
+    """
+    lower_table = bytearray(range(256))
+    case_toggles = bytearray(256)
+    multichar_case = bytearray()
+    for byte in range(256):
+        lower, upper = chr(byte).lower(), chr(byte).upper()
+        if lower == upper:
+            continue
+        # Only letters whose both cases fit in a single latin-1 byte can be toggled
+        if len(lower) == len(upper) == 1 and max(ord(lower), ord(upper)) < 256:
+            lower_table[byte] = ord(lower)
+            case_toggles[ord(lower)] = ord(lower) ^ ord(upper)
+        elif max(map(ord, lower + upper)) < 256:
+            multichar_case.append(byte)
+    return bytes(lower_table), bytes(case_toggles), bytes(multichar_case)
+
+
+LOWER_TABLE, CASE_TOGGLES, MULTICHAR_CASE_BYTES = _build_case_tables()
+
+
+def _gray_case_variants(word):
+    """
+    Return all combinations of uppercase and lowercase letters of a word.
+
+    The word is loaded as a single little-endian integer and the variants are
+    enumerated as a binary counter over its letters in Gray code order, so every
+    step is a single XOR with the case bit mask of one letter.
+
+    Args:
+        word (bytes): The latin-1 encoded word.
+
+    Returns:
+        list: Every case combination of the word.
+    """
+    lower = word.translate(LOWER_TABLE)
+    length = len(lower)
+    masks = [CASE_TOGGLES[byte] << (8 * position) for position, byte in enumerate(lower) if CASE_TOGGLES[byte]]
+
+    value = int.from_bytes(lower, 'little')
+    variants = [lower]
+    append = variants.append
+    for i in range(1, 1 << len(masks)):
+        # The lowest set bit of the counter is the only letter that changes
+        value ^= masks[(i & -i).bit_length() - 1]
+        append(value.to_bytes(length, 'little'))
+    return variants
+
+
+def _str_case_variants(word):
+    """
+    Yield all combinations of uppercase and lowercase letters of a word with
+    str.lower() and str.upper(), for letters such as 'ß' whose uppercase form
+    is several characters. Case forms outside latin-1 are left out.
+
+    Args:
+        word (bytes): The latin-1 encoded word.
+
+    Yields:
+        bytes: Every case combination of the word.
+    """
+    options = []
+    for char in word.decode('latin-1'):
+        cases = []
+        for case in dict.fromkeys((char.lower(), char.upper())):
+            try:
+                cases.append(case.encode('latin-1'))
+            except UnicodeEncodeError:
+                pass
+        options.append(cases)
+
+    for combo in itertools.product(*options):
+        yield b''.join(combo)
+
+
+def _case_variants(word):
+    """
+    Yield all combinations of uppercase and lowercase letters of a word.
+
+    Both halves of the word are enumerated separately and then concatenated,
+    which keeps the per-variant work down to a single bytes concatenation.
+    Words with letters that cannot be toggled in place go through _str_case_variants().
+
+    Args:
+        word (bytes): The latin-1 encoded word.
+
+    Yields:
+        bytes: Every case combination of the word, without duplicates.
+    """
+    if len(word.translate(None, MULTICHAR_CASE_BYTES)) != len(word):
+        yield from _str_case_variants(word)
+        return
+
+    half = len(word) // 2
+    tails = _gray_case_variants(word[half:])
+    for head in _gray_case_variants(word[:half]):
+        yield from [head + tail for tail in tails]
 
+
+def _read_chunks(file, chunk_size=CHUNK_SIZE):
+    """
+    Read a dictionary file in newline-aligned chunks.
+
+    Regular files are read through a memory map. Pipes, FIFOs and files that
+    cannot be mapped are read sequentially, carrying the partial last line of
+    every read over to the next chunk.
+
+    Args:
+        file (str): Path to the dictionary file.
+        chunk_size (int): Minimum size in bytes of every chunk.
+
+    Yields:
+        bytes: Every chunk, made of whole lines.
+    """
+    with open(file, 'rb') as f:
+        mm = None
+        if stat.S_ISREG(os.fstat(f.fileno()).st_mode):
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # Empty files cannot be memory-mapped, read them like any other stream
+                pass
+
+        if mm is not None:
+            with mm:
+                start = 0
+                while start < len(mm):
+                    # Extend the chunk up to the end of the line it ends in
+                    end = mm.find(b'\n', start + chunk_size)
+                    end = len(mm) if end == -1 else end + 1
+                    yield mm[start:end]
+                    start = end
+            return
+
+        pending = b''
+        while True:
+            data = f.read(chunk_size)
+            if not data:
+                break
+
+            # Keep the partial last line for the next chunk
+            data = pending + data
+            end = data.rfind(b'\n') + 1
+            pending = data[end:]
+            if end:
+                yield data[:end]
+
+        if pending:
+            yield pending
+
+
+@functools.lru_cache(maxsize=32)
 def parse_charset(charset):
     """
     Parse the charset argument to return the corresponding characters.
@@ -14,82 +235,161 @@ def parse_charset(charset):
     Returns:
         str: The corresponding characters.
     """
-    predefined_charsets = {
-        '?l': 'abcdefghijklmnopqrstuvwxyz',  # Lowercase letters
-        '?u': 'ABCDEFGHIJKLMNOPQRSTUVWXYZ',  # Uppercase letters
-        '?d': '0123456789',  # Digits
-        '?h': '0123456789abcdef',  # Hexadecimal (lowercase)
-        '?H': '0123456789ABCDEF',  # Hexadecimal (uppercase)
-        '?s': r'!"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~',  # Special characters
-        '?a': 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~' # Alphanumeric + special characters
-    }
-
     # If charset contains predefined set, return corresponding string
-    if charset in predefined_charsets:
-        return predefined_charsets[charset]
+    if charset in PREDEFINED_CHARSETS:
+        return PREDEFINED_CHARSETS[charset]
 
     # Else, return charset as a custom string
     return charset
 
 
-def extractWords(file, max_length=None, exact_length=None, min_length=None, conditions="", output="extractedWords.txt"):
+@functools.lru_cache(maxsize=32)
+def parse_conditions(conditions):
     """
-    Extract words from a dictionary file, filtering based on length and conditions.
+    Parse the conditions argument to return the blacklisted characters.
+    Supports both predefined blacklists and custom input.
 
     Args:
-        file (str): Path to the dictionary file.
-        max_length (int, optional): Maximum allowed word length.
-        exact_length (int, optional): Exact length of words to include.
-        min_length (int, optional): Minimum allowed word length.
-        conditions (str, optional): Characters that act as a blacklist.
-        output (str): Output file to save the results.
+        conditions (str): The conditions string (e.g., ?a?s, xyz, etc.).
 
     Returns:
-        None: Results are saved to the specified file.
+        bytes: The blacklisted characters, latin-1 encoded.
     """
-    filtered_words = []
-    blacklist = set()
-
-    # Define the predefined blacklists
-    predefined_blacklists = {
-        '?l': 'abcdefghijklmnopqrstuvwxyz',  # Lowercase letters
-        '?u': 'ABCDEFGHIJKLMNOPQRSTUVWXYZ',  # Uppercase letters
-        '?d': '0123456789',  # Digits
-        '?a': 'áéíóúÁÉÍÓÚñÑüÜ',  # Accents
-        '?s': r'!"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~'  # Special characters
-    }
+    # Lookup table indexed by byte value, set for every blacklisted byte
+    mask = bytearray(256)
 
     # Convert conditions into a cumulative blacklist
     if conditions:
         for condition in conditions.split('?'):
             if condition:
                 key = '?' + condition  # Recreate the key (e.g., '?s', '?a')
-                if key in predefined_blacklists:
-                    blacklist.update(predefined_blacklists[key])
-                else:
-                    blacklist.update(condition)  # Allow custom blacklists
+                # Allow custom blacklists
+                for char in PREDEFINED_BLACKLISTS.get(key, condition):
+                    # Characters outside latin-1 can never appear in the decoded words
+                    if ord(char) < 256:
+                        mask[ord(char)] = 1
+
+    return bytes(byte for byte in range(256) if mask[byte])
+
+
+def _iter_words(file):
+    """
+    Yield the words of a dictionary file.
+
+    Args:
+        file (str): Path to the dictionary file.
+
+    Yields:
+        bytes: Every line of the file without surrounding whitespace.
+    """
+    for chunk in _read_chunks(file):
+        for line in chunk.splitlines():
+            yield line.strip(LATIN1_WHITESPACE)
 
-    try:
-        with open(file, 'r', encoding='latin-1') as f:
-            for line in f:
-                word = line.strip()
-                word_length = len(word)
 
-                # Check length conditions
-                if ((max_length is not None and word_length > max_length) or
-                    (exact_length is not None and word_length != exact_length) or
-                    (min_length is not None and word_length < min_length)):
-                    continue
+def _filter_words(lines, max_length=None, exact_length=None, min_length=None, blacklist_bytes=b''):
+    """
+    Yield the words matching the length and blacklist conditions.
+
+    Args:
+        lines (iterable): The lines to filter, as bytes.
+        max_length (int, optional): Maximum allowed word length.
+        exact_length (int, optional): Exact length of words to include.
+        min_length (int, optional): Minimum allowed word length.
+        blacklist_bytes (bytes, optional): Blacklisted characters, as returned by parse_conditions().
+
+    Yields:
+        bytes: Every word passing the filters, without surrounding whitespace.
+    """
+    whitespace = LATIN1_WHITESPACE
+
+    # Stripping can only shorten a line, so lines under the lower bound are rejected before it
+    lower_bound = exact_length if exact_length is not None else min_length
+    if lower_bound is None:
+        lower_bound = 0
+
+    for line in lines:
+        if len(line) < lower_bound:
+            continue
+
+        word = line.strip(whitespace)
+        word_length = len(word)
+
+        # Check length conditions
+        if ((max_length is not None and word_length > max_length) or
+            (exact_length is not None and word_length != exact_length) or
+            (min_length is not None and word_length < min_length)):
+            continue
+
+        # Check blacklist if conditions are provided, a word containing any blacklisted byte
+        # is changed when they are removed with bytes.translate
+        if blacklist_bytes and word.translate(None, blacklist_bytes) != word:
+            continue
+
+        yield word
+
+
+def _extract_chunk(chunk, max_length=None, exact_length=None, min_length=None, blacklist_bytes=b''):
+    """
+    Filter the words of a chunk of a dictionary file.
+
+    Args:
+        chunk (bytes): Newline-aligned chunk of the dictionary file.
+        max_length (int, optional): Maximum allowed word length.
+        exact_length (int, optional): Exact length of words to include.
+        min_length (int, optional): Minimum allowed word length.
+        blacklist_bytes (bytes, optional): Blacklisted characters, as returned by parse_conditions().
+
+    Returns:
+        bytes: The words passing the filters, one per line.
+    """
+    words = list(_filter_words(chunk.splitlines(), max_length, exact_length, min_length, blacklist_bytes))
+    return b"\n".join(words) + b"\n" if words else b""
+
+
+def _iter_extract(file, max_length=None, exact_length=None, min_length=None, conditions=""):
+    """
+    Yield the words of a dictionary file matching the length and blacklist conditions.
+
+    Args:
+        file (str): Path to the dictionary file.
+        max_length (int, optional): Maximum allowed word length.
+        exact_length (int, optional): Exact length of words to include.
+        min_length (int, optional): Minimum allowed word length.
+        conditions (str, optional): Characters that act as a blacklist.
 
-                # Check blacklist if conditions are provided
-                if blacklist and any(char in blacklist for char in word):
-                    continue
+    Yields:
+        bytes: Every word passing the filters.
+    """
+    blacklist_bytes = parse_conditions(conditions)
 
-                filtered_words.append(word)
+    for chunk in _read_chunks(file):
+        yield from _filter_words(chunk.splitlines(), max_length, exact_length, min_length, blacklist_bytes)
 
-        # Save results to the output file in append mode
-        with open(output, 'a', encoding='latin-1') as out_file:
-            out_file.write("\n".join(filtered_words) + "\n")
+
+def extractWords(file, max_length=None, exact_length=None, min_length=None, conditions="", output="extractedWords.txt"):
+    """
+    Extract words from a dictionary file, filtering based on length and conditions.
+
+    Args:
+        file (str): Path to the dictionary file.
+        max_length (int, optional): Maximum allowed word length.
+        exact_length (int, optional): Exact length of words to include.
+        min_length (int, optional): Minimum allowed word length.
+        conditions (str, optional): Characters that act as a blacklist.
+        output (str): Output file to save the results.
+
+    Returns:
+        None: Results are saved to the specified file.
+    """
+    try:
+        extract_chunk = functools.partial(_extract_chunk, max_length=max_length, exact_length=exact_length,
+                                          min_length=min_length, blacklist_bytes=parse_conditions(conditions))
+
+        # Save results to the output file in append mode, every chunk is written at once
+        with open(output, 'ab', buffering=0) as out_file:
+            for chunk in _read_chunks(file):
+                out_file.write(extract_chunk(chunk))
 
         print(f"Extracted words saved to: {output}")
 
@@ -99,7 +399,292 @@ def extractWords(file, max_length=None, exact_length=None, min_length=None, cond
         print(f"An error occurred: {e}")
 
 
-def generateDictionary(file, max_length, charset, output="generatedDictionary.txt", prepend=False):
+class _DirectWriter:
+    """
+    Append-only binary writer bypassing the page cache with O_DIRECT.
+
+    Data is packed into a page-aligned buffer that is written in full blocks.
+    Writes that are not a multiple of the alignment, i.e. the bytes aligning
+    the end of an existing file and the final tail, go through a regular file
+    descriptor.
+    """
+
+    def __init__(self, output, buffer_size=BUFFER_SIZE):
+        self.plain_fd = os.open(output, os.O_WRONLY | os.O_CREAT | os.O_APPEND)
+        try:
+            self.direct_fd = os.open(output, os.O_WRONLY | os.O_APPEND | os.O_DIRECT)
+        except OSError:
+            os.close(self.plain_fd)
+            raise
+
+        # Anonymous mappings are page-aligned, as required by O_DIRECT
+        self.buf = mmap.mmap(-1, buffer_size)
+        self.pos = 0
+        # Bytes to write before the end of the file is aligned
+        self.unaligned = -os.fstat(self.plain_fd).st_size % DIRECT_ALIGNMENT
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def _write_all(fd, view):
+        """Write a whole memoryview, releasing the slices taken on partial writes."""
+        written = os.write(fd, view)
+        while written < len(view):
+            with view[written:] as rest:
+                written += os.write(fd, rest)
+
+    def write(self, data):
+        # Views are released explicitly so the caller can resize its buffer right
+        # after, also on interpreters without reference counting
+        with memoryview(data) as view, view.cast('B') as data:
+            start = 0
+
+            if self.unaligned:
+                with data[:self.unaligned] as head:
+                    self._write_all(self.plain_fd, head)
+                    self.unaligned -= len(head)
+                    start = len(head)
+
+            while start < len(data):
+                size = min(len(data) - start, len(self.buf) - self.pos)
+                with data[start:start + size] as part:
+                    self.buf[self.pos:self.pos + size] = part
+                self.pos += size
+                start += size
+
+                # Write the buffer once it is full
+                if self.pos == len(self.buf):
+                    with memoryview(self.buf) as block:
+                        self._write_all(self.direct_fd, block)
+                    self.pos = 0
+
+    def close(self):
+        if self.buf.closed:
+            return
+        try:
+            with memoryview(self.buf) as block, block[:self.pos] as tail:
+                self._write_all(self.plain_fd, tail)
+        finally:
+            self.buf.close()
+            os.close(self.direct_fd)
+            os.close(self.plain_fd)
+
+
+def _open_output(output, direct=False):
+    """
+    Open an output file in binary append mode.
+
+    Args:
+        output (str): Output file to open.
+        direct (bool): Whether to bypass the page cache with O_DIRECT when supported.
+
+    Returns:
+        file: A writable binary file object.
+    """
+    if direct:
+        if hasattr(os, 'O_DIRECT'):
+            try:
+                return _DirectWriter(output)
+            except OSError as e:
+                print(f"Warning: O_DIRECT is not supported for '{output}' ({e}), using buffered writes.")
+        else:
+            print("Warning: O_DIRECT is not supported on this platform, using buffered writes.")
+    return open(output, 'ab')
+
+
+@functools.lru_cache(maxsize=None)
+def _padding_tails(charset, tail_length):
+    """
+    Return every padding of a given length, built once and shared by all the words.
+
+    Args:
+        charset (tuple): Single-byte characters to pad with.
+        tail_length (int): Number of padding characters.
+
+    Returns:
+        list: Every combination of tail_length characters from the charset, in order.
+    """
+    return [b''.join(tail) for tail in itertools.product(charset, repeat=tail_length)]
+
+
+def _padded_batches(charset, padding_length, left, right):
+    """
+    Yield every padding combination placed between the left and right parts of a word,
+    in batches of rows.
+
+    The padding is split into a head and a tail of up to BATCH_ROWS combinations.
+    The tails are built once, and every head then produces a whole batch of rows
+    with a single bytes.join, since the rows of a batch only differ by their tail.
+
+    Args:
+        charset (tuple): Single-byte characters to pad with.
+        padding_length (int): Number of padding characters.
+        left (bytes): Bytes placed before the padding.
+        right (bytes): Bytes placed after the padding, ending with a newline.
+
+    Yields:
+        bytes: Batches of padded rows, each one ending with a newline.
+    """
+    # Number of trailing padding characters enumerated in every batch
+    tail_length = 0
+    while tail_length < padding_length and len(charset) ** (tail_length + 1) <= BATCH_ROWS:
+        tail_length += 1
+
+    tails = _padding_tails(charset, tail_length)
+    if not tails:
+        return
+
+    join = b''.join
+    for head in itertools.product(charset, repeat=padding_length - tail_length):
+        prefix = left + join(head)
+        yield prefix + (right + prefix).join(tails) + right
+
+
+def _write_padded(out_file, buf, charset, padding_length, left, right):
+    """
+    Write every padding combination placed between the left and right parts of a word.
+
+    Args:
+        out_file (file): Binary file the rows are flushed to.
+        buf (bytearray): Output buffer, flushed to out_file once it is full.
+        charset (tuple): Single-byte characters to pad with.
+        padding_length (int): Number of padding characters.
+        left (bytes): Bytes placed before the padding.
+        right (bytes): Bytes placed after the padding, ending with a newline.
+    """
+    write = out_file.write
+    for batch in _padded_batches(charset, padding_length, left, right):
+        buf += batch
+
+        # Flush the buffer once it is full
+        if len(buf) >= BUFFER_SIZE:
+            write(buf)
+            buf.clear()
+
+
+def _pad_chunk(args):
+    """
+    Worker process writing the padded words whose padding starts with a given character.
+
+    Args:
+        args (tuple): The word, charset, padding length, first padding character,
+                      prepend flag and temporary file to write to.
+    """
+    word, charset, padding_length, first_char, prepend, tmpfile = args
+    with open(tmpfile, 'wb') as out_file:
+        buf = bytearray()
+        if prepend:
+            _write_padded(out_file, buf, charset, padding_length - 1, first_char, word + b'\n')
+        else:
+            _write_padded(out_file, buf, charset, padding_length - 1, word + first_char, b'\n')
+        out_file.write(buf)
+
+
+def _append_file(path, out_file, use_sendfile=True):
+    """
+    Append the contents of a file to an output file.
+
+    The bytes are moved inside the kernel with os.sendfile when both the platform
+    and the output file allow it, and copied with shutil.copyfileobj otherwise.
+    A sendfile failure is reported and the copy resumes from the offset reached.
+
+    Args:
+        path (str): File to copy.
+        out_file (file): Binary output file.
+        use_sendfile (bool): Whether to try os.sendfile before copying through user space.
+
+    Returns:
+        bool: Whether os.sendfile can still be used for the following files.
+    """
+    with open(path, 'rb') as src:
+        offset = 0
+        # O_DIRECT writers have no file descriptor usable with unaligned sizes
+        if use_sendfile and hasattr(out_file, 'fileno'):
+            out_file.flush()
+            size = os.fstat(src.fileno()).st_size
+
+            # sendfile rejects output descriptors opened with O_APPEND, so write
+            # through a separate descriptor positioned at the end of the file
+            out_fd = os.open(out_file.name, os.O_WRONLY)
+            try:
+                os.lseek(out_fd, 0, os.SEEK_END)
+                while offset < size:
+                    sent = os.sendfile(out_fd, src.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except OSError as e:
+                use_sendfile = False
+                print(f"Warning: os.sendfile is not usable for '{out_file.name}' ({e}), copying through user space.")
+            finally:
+                os.close(out_fd)
+
+        # Copy whatever was not sent through user space
+        src.seek(offset)
+        shutil.copyfileobj(src, out_file, BUFFER_SIZE)
+
+    return use_sendfile
+
+
+def _pad_parallel(pool, tmpdir, out_file, word, charset, padding_length, prepend, use_sendfile=True):
+    """
+    Pad a word across worker processes, one per first padding character, and
+    concatenate their results in charset order.
+
+    Args:
+        pool (multiprocessing.Pool): Pool of worker processes.
+        tmpdir (str): Directory holding the temporary files of the workers.
+        out_file (file): Binary output file.
+        word (bytes): The word to pad.
+        charset (tuple): Single-byte characters to pad with.
+        padding_length (int): Number of padding characters.
+        prepend (bool): Whether to prepend the padding to the word.
+        use_sendfile (bool): Whether to merge the results with os.sendfile.
+
+    Returns:
+        bool: Whether os.sendfile can still be used, see _append_file().
+    """
+    tmpfiles = [os.path.join(tmpdir, f"{i}.txt") for i in range(len(charset))]
+    pool.map(_pad_chunk, [(word, charset, padding_length, first_char, prepend, tmpfile)
+                          for first_char, tmpfile in zip(charset, tmpfiles)], chunksize=1)
+
+    for tmpfile in tmpfiles:
+        use_sendfile = _append_file(tmpfile, out_file, use_sendfile)
+
+    return use_sendfile
+
+
+def _iter_pad(words, max_length, charset, prepend=False):
+    """
+    Yield the words padded with every combination of characters from the charset
+    up to the specified length, in batches built by _padded_batches().
+
+    Args:
+        words (iterable): The words to pad, as bytes.
+        max_length (int): Maximum length of the generated word.
+        charset (str): Characters to pad with.
+        prepend (bool): Whether to prepend charset to the word instead of appending.
+
+    Yields:
+        bytes: Batches of padded words, one per line.
+    """
+    charset_bytes = tuple(c.encode('latin-1') for c in parse_charset(charset))
+
+    for word in words:
+        if len(word) == max_length:
+            yield word + b'\n'
+        elif len(word) < max_length:
+            if prepend:
+                yield from _padded_batches(charset_bytes, max_length - len(word), b'', word + b'\n')
+            else:
+                yield from _padded_batches(charset_bytes, max_length - len(word), word, b'\n')
+
+
+def generateDictionary(file, max_length, charset, output="generatedDictionary.txt", prepend=False, workers=1, direct=False):
     """
     Generate a new dictionary by padding each word with characters from the charset
     up to the specified length. Optionally prepend the charset instead of appending.
@@ -109,38 +694,57 @@ def generateDictionary(file, max_length, charset, output="generatedDictionary.tx
         charset (str): Characters to pad with.
         output (str): Output file to save the results.
         prepend (bool): Whether to prepend charset to the word instead of appending.
+        workers (int): Number of worker processes used for large paddings, 1 to pad in the main process.
+        direct (bool): Whether to write the output with O_DIRECT, bypassing the page cache.
     Returns:
         None: Results are saved to the specified file.
     """
+    pool = None
+    tmpdir = None
+
     try:
         # Parse the charset (either predefined or custom)
         charset = parse_charset(charset)
-
-        # Store the generated words
-        generated_words = []
-
-        # Read the input dictionary file
-        with open(file, 'r', encoding='latin-1') as f:
-            for line in f:
-                word = line.strip()
-                if len(word) == max_length:
+        charset_bytes = tuple(c.encode('latin-1') for c in charset)
+
+        # There is at most one task per first padding character
+        workers = min(workers, len(charset_bytes))
+        # Disabled for the rest of the run after the first sendfile failure
+        use_sendfile = hasattr(os, 'sendfile')
+
+        # Read the input dictionary file and stream the generated words to the output file
+        with _open_output(output, direct=direct) as out_file:
+            buf = bytearray()
+            for word_bytes in _iter_words(file):
+                if len(word_bytes) == max_length:
                     # If the word length matches max_length, add it directly
-                    generated_words.append(word)
-                elif len(word) < max_length:
+                    buf.extend(word_bytes)
+                    buf.append(0x0A)
+                elif len(word_bytes) < max_length:
                     # Calculate how many characters we need to pad to reach max_length
-                    padding_length = max_length - len(word)
-
-                    # Generate all combinations of padding
-                    for padding in itertools.product(charset, repeat=padding_length):
-                        if prepend:
-                            new_word = ''.join(padding) + word
-                        else:
-                            new_word = word + ''.join(padding)
-                        generated_words.append(new_word)
-
-        # Save the generated words to the output file in append mode
-        with open(output, 'a', encoding='latin-1') as out_file:
-            out_file.write("\n".join(generated_words) + "\n")
+                    padding_length = max_length - len(word_bytes)
+
+                    if workers > 1 and len(charset_bytes) ** padding_length >= PARALLEL_THRESHOLD:
+                        # Split large paddings across worker processes
+                        if pool is None:
+                            pool = multiprocessing.Pool(workers)
+                            # The temporary files are as large as the output, keep them on its filesystem
+                            tmpdir = tempfile.mkdtemp(dir=os.path.dirname(os.path.abspath(output)))
+                        out_file.write(buf)
+                        buf.clear()
+                        use_sendfile = _pad_parallel(pool, tmpdir, out_file, word_bytes, charset_bytes,
+                                                     padding_length, prepend, use_sendfile)
+                    elif prepend:
+                        _write_padded(out_file, buf, charset_bytes, padding_length, b'', word_bytes + b'\n')
+                    else:
+                        _write_padded(out_file, buf, charset_bytes, padding_length, word_bytes, b'\n')
+
+                if len(buf) >= BUFFER_SIZE:
+                    out_file.write(buf)
+                    buf.clear()
+
+            # Write the remaining words
+            out_file.write(buf)
 
         print(f"Generated words saved to: {output}")
 
@@ -148,6 +752,70 @@ def generateDictionary(file, max_length, charset, output="generatedDictionary.tx
         print(f"Error: File '{file}' not found.")
     except Exception as e:
         print(f"An error occurred: {e}")
+    finally:
+        if pool is not None:
+            pool.terminate()
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def _write_words(out_file, words):
+    """
+    Write words to a binary file, one per line, through a 1 MiB buffer.
+
+    Args:
+        out_file (file): Binary file the words are written to.
+        words (iterable): The words to write, as bytes.
+    """
+    buf = bytearray()
+    append = buf.append
+    write = out_file.write
+    for word in words:
+        buf += word
+        append(0x0A)
+
+        # Flush the buffer once it is full
+        if len(buf) >= BUFFER_SIZE:
+            write(buf)
+            buf.clear()
+
+    # Write the remaining words
+    write(buf)
+
+
+def _iter_combo(words, extended=False):
+    """
+    Yield all combinations of uppercase and lowercase letters of the given words,
+    without duplicates. Optionally include common character substitutions.
+
+    Args:
+        words (iterable): The words to combine, as bytes.
+        extended (bool): Whether to include common character substitutions.
+
+    Yields:
+        bytes: Every combination of the words.
+    """
+    # Precompute one translation table per substitution so each one is a single C pass
+    substitution_tables = [(ord(char), bytes.maketrans(char.encode('latin-1'), sub.encode('latin-1')))
+                           for char, subs in SUBSTITUTIONS.items() for sub in subs]
+
+    # Words already yielded, used to skip duplicates
+    seen = set()
+    seen_add = seen.add
+
+    for word in words:
+        # Generate combinations of uppercase and lowercase
+        for combo in _case_variants(word):
+            variants = (combo,)
+
+            if extended:
+                # Generate combinations with character substitutions
+                variants = [combo]
+                variants += [combo.translate(table) for char, table in substitution_tables if char in combo]
+
+            for variant in variants:
+                if variant not in seen:
+                    seen_add(variant)
+                    yield variant
 
 
 def generateCombinatory(file, output="combinatoryDictionary.txt", extended=False):
@@ -163,45 +831,9 @@ def generateCombinatory(file, output="combinatoryDictionary.txt", extended=False
     Returns:
         None: Results are saved to the specified file.
     """
-    substitutions = {
-        'a': ['4', '@'],
-        'b': ['8'],
-        'c': ['<', '('],
-        'e': ['3'],
-        'g': ['6', '9'],
-        'i': ['1', '!'],
-        'l': ['1', '|'],
-        'o': ['0'],
-        's': ['5', '$'],
-        't': ['7', '+'],
-        'z': ['2'],
-        # Add more substitutions as needed
-    }
-
     try:
-        generated_words = []
-
-        with open(file, 'r', encoding='latin-1') as f:
-            for line in f:
-                word = line.strip()
-
-                # Generate combinations of uppercase and lowercase
-                combos = set(''.join(c) for c in itertools.product(*[(char.lower(), char.upper()) for char in word]))
-                generated_words.extend(combos)
-
-                if extended:
-                    # Generate combinations with character substitutions
-                    for combo in combos:
-                        substitutions_combos = set(combo)
-                        for char, subs in substitutions.items():
-                            if char in combo:
-                                for sub in subs:
-                                    substitutions_combos.add(combo.replace(char, sub))
-                        generated_words.extend(substitutions_combos)
-
-        # Save to the output file
-        with open(output, 'a', encoding='latin-1') as out_file:
-            out_file.write("\n".join(set(generated_words)) + "\n")
+        with open(output, 'ab', buffering=0) as out_file:
+            _write_words(out_file, _iter_combo(_iter_words(file), extended=extended))
 
         print(f"Combinatory words saved to: {output}")
 
@@ -211,6 +843,55 @@ def generateCombinatory(file, output="combinatoryDictionary.txt", extended=False
         print(f"An error occurred: {e}")
 
 
+def pipeline(file, max_length=None, exact_length=None, min_length=None, conditions="", pad_length=None,
+             charset=None, prepend=False, combinatory=False, extended=False, output="pipelineDictionary.txt"):
+    """
+    Extract, pad and combine the words of a dictionary in a single pass, without
+    writing the intermediate dictionaries to disk.
+
+    Args:
+        file (str): Path to the dictionary file.
+        max_length (int, optional): Maximum allowed length of the extracted words.
+        exact_length (int, optional): Exact length of the extracted words.
+        min_length (int, optional): Minimum allowed length of the extracted words.
+        conditions (str, optional): Characters that act as a blacklist.
+        pad_length (int, optional): Length to pad the words to. Padding is skipped if not set.
+        charset (str, optional): Characters to pad with.
+        prepend (bool): Whether to prepend charset to the word instead of appending.
+        combinatory (bool): Whether to generate uppercase and lowercase combinations.
+        extended (bool): Whether to include common character substitutions (implies combinatory).
+        output (str): Output file to save the results.
+
+    Returns:
+        None: Results are saved to the specified file.
+    """
+    try:
+        words = _iter_extract(file, max_length=max_length, exact_length=exact_length,
+                              min_length=min_length, conditions=conditions)
+        batches = None
+        if pad_length is not None:
+            batches = _iter_pad(words, pad_length, charset, prepend=prepend)
+            words = (word for batch in batches for word in batch.splitlines())
+        if combinatory or extended:
+            words = _iter_combo(words, extended=extended)
+            batches = None
+
+        with open(output, 'ab', buffering=0) as out_file:
+            if batches is not None:
+                # Padding is the last stage, write its batches as they are
+                for batch in batches:
+                    out_file.write(batch)
+            else:
+                _write_words(out_file, words)
+
+        print(f"Pipeline words saved to: {output}")
+
+    except FileNotFoundError:
+        print(f"Error: File '{file}' not found.")
+    except Exception as e:
+        print(f"An error occurred: {e}")
+
+
 def main():
     # Create the main parser
     parser = argparse.ArgumentParser(description="Word Generator")
@@ -264,6 +945,8 @@ def main():
     generate_parser.add_argument('-c', '--charset', type=str, required=True, help="Characters to pad the words.")
     generate_parser.add_argument('-p', '--prepend', action='store_true', help="Prepend characters instead of appending.")
     generate_parser.add_argument('-o', '--output', type=str, default="generatedDictionary.txt", help="Output file name.")
+    generate_parser.add_argument('-w', '--workers', type=int, default=1, help="Number of worker processes used for large paddings (default: 1).")
+    generate_parser.add_argument('-d', '--direct', action='store_true', help="Write the output with O_DIRECT, bypassing the page cache (large outputs).")
 
     # Parser for 'generateCombinatory' function
     combinatory_parser = subparsers.add_parser(
@@ -291,15 +974,48 @@ def main():
     combinatory_parser.add_argument('-o', '--output', type=str, default="combinatoryDictionary.txt", help="Output file name.")
     combinatory_parser.add_argument('-e', '--extended', action='store_true', help="Include common character substitutions.")
 
+    # Parser for 'pipeline' function
+    pipeline_parser = subparsers.add_parser(
+        'pipeline',
+        help="Extract, pad and combine words in a single pass.",
+        description=(
+            "Chain extractWords, generateDictionary and generateCombinatory in a single pass\n"
+            "over the dictionary, without writing the intermediate dictionaries to disk.\n"
+            "Padding is applied when --pad-length is given, combinations when --combinatory\n"
+            "or --extended is given."
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    pipeline_parser.add_argument('-f', '--file', type=str, required=True, help="Path to the dictionary file.")
+    pipeline_parser.add_argument('-b', '--conditions', type=str, default="", help="Blacklist characters to exclude from the wordlist.")
+    pipeline_length_group = pipeline_parser.add_mutually_exclusive_group()
+    pipeline_length_group.add_argument('-x', '--max-length', type=int, help="Get words with length lower or equal.")
+    pipeline_length_group.add_argument('-n', '--exact-length', type=int, help="Get words with the exact word length.")
+    pipeline_length_group.add_argument('-m', '--min-length', type=int, help="Get words with length greater or equal.")
+    pipeline_parser.add_argument('-l', '--pad-length', type=int, help="Length to pad the words to.")
+    pipeline_parser.add_argument('-s', '--charset', type=str, help="Characters to pad the words.")
+    pipeline_parser.add_argument('-p', '--prepend', action='store_true', help="Prepend characters instead of appending.")
+    pipeline_parser.add_argument('-k', '--combinatory', action='store_true', help="Generate uppercase and lowercase combinations.")
+    pipeline_parser.add_argument('-E', '--extended', action='store_true', help="Include common character substitutions.")
+    pipeline_parser.add_argument('-o', '--output', type=str, default="pipelineDictionary.txt", help="Output file name.")
+
     # Parse the arguments
     args = parser.parse_args()
 
+    if args.command == 'pipeline':
+        if args.pad_length is not None and args.charset is None:
+            pipeline_parser.error("--pad-length requires --charset")
+        if args.pad_length is None and (args.charset is not None or args.prepend):
+            pipeline_parser.error("--charset and --prepend require --pad-length")
+
     if args.command == 'extractWords':
         extractWords(file=args.file, max_length=args.max_length, exact_length=args.exact_length, min_length=args.min_length, conditions=args.conditions, output=args.output)
     elif args.command == 'generateDictionary':
-        generateDictionary(file=args.file, max_length=args.max_length, charset=args.charset, prepend=args.prepend, output=args.output)
+        generateDictionary(file=args.file, max_length=args.max_length, charset=args.charset, prepend=args.prepend, output=args.output, workers=args.workers, direct=args.direct)
     elif args.command == 'generateCombinatory':
         generateCombinatory(file=args.file, output=args.output, extended=args.extended)
+    elif args.command == 'pipeline':
+        pipeline(file=args.file, max_length=args.max_length, exact_length=args.exact_length, min_length=args.min_length, conditions=args.conditions, pad_length=args.pad_length, charset=args.charset, prepend=args.prepend, combinatory=args.combinatory, extended=args.extended, output=args.output)
 
 
 if __name__ == "__main__":
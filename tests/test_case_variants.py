@@ -0,0 +1,41 @@
+import itertools
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dictionaryGenerator  # noqa: E402
+
+
+def str_variants(word):
+    """Case combinations built with str.lower() and str.upper(), as a reference."""
+    return {''.join(combo) for combo in itertools.product(*[(char.lower(), char.upper()) for char in word])}
+
+
+class CaseVariantsTest(unittest.TestCase):
+    """Byte-level case combinations must match the str-based product."""
+
+    def variants(self, word):
+        variants = list(dictionaryGenerator._case_variants(word.encode('latin-1')))
+        self.assertEqual(len(variants), len(set(variants)))
+        return {variant.decode('latin-1') for variant in variants}
+
+    def test_matches_str_product(self):
+        for word in ("", "a", "Password1", "ÉtéÀÖ", "x" * 9 + "Y7"):
+            with self.subTest(word=word):
+                self.assertEqual(self.variants(word), str_variants(word))
+
+    def test_multichar_uppercase_is_kept(self):
+        for word in ("straße", "ßs", "Groß1"):
+            with self.subTest(word=word):
+                self.assertEqual(self.variants(word), str_variants(word))
+        self.assertIn("STRASSE", self.variants("straße"))
+
+    def test_cases_outside_latin1_are_skipped(self):
+        # The uppercase forms of 'µ' and 'ÿ' are Greek and Latin Extended letters
+        self.assertEqual(self.variants("µÿa"), {"µÿa", "µÿA"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dictionaryGenerator  # noqa: E402
+
+
+class DirectWriterTest(unittest.TestCase):
+    """Output written with O_DIRECT must be byte-identical to a regular append."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = os.path.join(self.tmpdir.name, "output.txt")
+
+        if not hasattr(os, 'O_DIRECT'):
+            self.skipTest("O_DIRECT is not available on this platform")
+        try:
+            dictionaryGenerator._DirectWriter(self.path).close()
+        except OSError as e:
+            self.skipTest(f"O_DIRECT is not supported by the temporary filesystem: {e}")
+        os.unlink(self.path)
+
+    def append_direct(self, existing, chunks):
+        with open(self.path, 'wb') as f:
+            f.write(existing)
+
+        # Reuse and clear a single buffer, like the generators do
+        buf = bytearray()
+        with dictionaryGenerator._DirectWriter(self.path) as writer:
+            for chunk in chunks:
+                buf += chunk
+                writer.write(buf)
+                buf.clear()
+
+        with open(self.path, 'rb') as f:
+            return f.read()
+
+    def random_chunks(self, total, seed):
+        rng = random.Random(seed)
+        chunks = []
+        while total > 0:
+            size = min(total, rng.randint(1, 3 * dictionaryGenerator.BUFFER_SIZE // 2))
+            chunks.append(rng.randbytes(size))
+            total -= size
+        return chunks
+
+    def test_existing_sizes(self):
+        alignment = dictionaryGenerator.DIRECT_ALIGNMENT
+        for existing_size in (0, 6, alignment - 1, alignment, alignment + 904):
+            with self.subTest(existing_size=existing_size):
+                existing = b'x' * existing_size
+                chunks = self.random_chunks(8_800_000, seed=existing_size)
+                self.assertEqual(self.append_direct(existing, chunks), existing + b''.join(chunks))
+
+    def test_write_shorter_than_alignment_gap(self):
+        chunks = [b'abc', b'', b'defghij']
+        self.assertEqual(self.append_direct(b'123456', chunks), b'123456abcdefghij')
+
+    def test_full_blocks(self):
+        chunks = [b'y' * dictionaryGenerator.BUFFER_SIZE] * 3
+        self.assertEqual(self.append_direct(b'', chunks), b''.join(chunks))
+
+    def test_generate_dictionary(self):
+        with tempfile.NamedTemporaryFile('wb', suffix=".txt", delete=False) as f:
+            f.write(b"ab\nhello\nxyz12\n")
+        self.addCleanup(os.unlink, f.name)
+
+        outputs = []
+        for direct in (False, True):
+            output = os.path.join(self.tmpdir.name, f"direct_{direct}.txt")
+            with open(output, 'wb') as out_file:
+                out_file.write(b"existing\n")
+            with contextlib.redirect_stdout(io.StringIO()):
+                dictionaryGenerator.generateDictionary(f.name, 8, '?d', output=output, workers=1, direct=direct)
+            with open(output, 'rb') as out_file:
+                outputs.append(out_file.read())
+
+        self.assertGreater(len(outputs[0]), dictionaryGenerator.BUFFER_SIZE)
+        self.assertEqual(outputs[1], outputs[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import contextlib
+import errno
+import io
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dictionaryGenerator  # noqa: E402
+
+WORDLIST = b"ab\nhello\nxyz12\nabcdef\n"
+EXISTING = b"existing line\n"
+
+
+class ParallelPaddingTest(unittest.TestCase):
+    """Padding split across worker processes must match padding in the main process."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.wordlist = os.path.join(self.tmpdir.name, "words.txt")
+        with open(self.wordlist, 'wb') as f:
+            f.write(WORDLIST)
+
+    def generate(self, name, existing=b"", **kwargs):
+        output = os.path.join(self.tmpdir.name, name)
+        with open(output, 'wb') as f:
+            f.write(existing)
+
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            dictionaryGenerator.generateDictionary(self.wordlist, 7, "abc", output=output, **kwargs)
+
+        with open(output, 'rb') as f:
+            return f.read(), stdout.getvalue()
+
+    def test_workers_match_main_process(self):
+        # Send every padding of at least two characters to the worker processes
+        with mock.patch.object(dictionaryGenerator, 'PARALLEL_THRESHOLD', 9):
+            for prepend in (False, True):
+                with self.subTest(prepend=prepend):
+                    serial, _ = self.generate("serial.txt", prepend=prepend, workers=1)
+                    parallel, _ = self.generate("parallel.txt", prepend=prepend, workers=4)
+                    self.assertGreater(len(serial), 0)
+                    self.assertEqual(parallel, serial)
+
+    @unittest.skipUnless(hasattr(os, 'sendfile'), "os.sendfile is not available")
+    def test_sendfile_appends_to_existing_output(self):
+        with mock.patch.object(dictionaryGenerator, 'PARALLEL_THRESHOLD', 9), \
+                mock.patch.object(os, 'sendfile', wraps=os.sendfile) as sendfile:
+            serial, _ = self.generate("serial.txt", existing=EXISTING, workers=1)
+            self.assertEqual(sendfile.call_count, 0)
+            parallel, stdout = self.generate("parallel.txt", existing=EXISTING, workers=4)
+
+        self.assertGreater(sendfile.call_count, 0)
+        self.assertNotIn("Warning", stdout)
+        self.assertTrue(serial.startswith(EXISTING))
+        self.assertEqual(parallel, serial)
+
+    @unittest.skipUnless(hasattr(os, 'sendfile'), "os.sendfile is not available")
+    def test_sendfile_failure_resumes_from_offset(self):
+        real_sendfile = os.sendfile
+        calls = []
+
+        def flaky_sendfile(out_fd, in_fd, offset, count):
+            # Send a few bytes, then fail as on a filesystem without sendfile support
+            calls.append(offset)
+            if len(calls) == 1:
+                return real_sendfile(out_fd, in_fd, offset, min(count, 5))
+            raise OSError(errno.EINVAL, "Invalid argument")
+
+        with mock.patch.object(dictionaryGenerator, 'PARALLEL_THRESHOLD', 9):
+            serial, _ = self.generate("serial.txt", existing=EXISTING, workers=1)
+            with mock.patch.object(os, 'sendfile', flaky_sendfile):
+                parallel, stdout = self.generate("parallel.txt", existing=EXISTING, workers=4)
+                self.assertEqual(calls, [0, 5])
+                self.assertEqual(stdout.count("Warning: os.sendfile is not usable"), 1)
+                self.assertEqual(parallel, serial)
+
+                # The failure only disables sendfile for the run that hit it
+                self.generate("parallel.txt", workers=4)
+                self.assertEqual(calls, [0, 5, 0])
+
+    def test_temporary_files_are_removed(self):
+        with mock.patch.object(dictionaryGenerator, 'PARALLEL_THRESHOLD', 9):
+            self.generate("parallel.txt", workers=4)
+        self.assertEqual(sorted(os.listdir(self.tmpdir.name)), ["parallel.txt", "words.txt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
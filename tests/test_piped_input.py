@@ -0,0 +1,49 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dictionaryGenerator.py")
+
+WORDLIST = b"hello\nworld12\n"
+
+
+class PipedInputTest(unittest.TestCase):
+    """Dictionaries read from a pipe must produce the same words as regular files."""
+
+    def run_command(self, args, stdin=None):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = os.path.join(tmpdir, "output.txt")
+            subprocess.run([sys.executable, SCRIPT] + args + ["-o", output], input=stdin,
+                           check=True, stdout=subprocess.DEVNULL)
+            with open(output, 'rb') as f:
+                return sorted(f.read().splitlines())
+
+    def assert_piped_matches_file(self, args):
+        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
+            f.write(WORDLIST)
+        try:
+            from_file = self.run_command(args + ["-f", f.name])
+        finally:
+            os.unlink(f.name)
+        from_pipe = self.run_command(args + ["-f", "/dev/stdin"], stdin=WORDLIST)
+
+        self.assertTrue(from_file)
+        self.assertEqual(from_pipe, from_file)
+
+    def test_extract_words(self):
+        self.assert_piped_matches_file(["extractWords", "-m", "3"])
+
+    def test_generate_dictionary(self):
+        self.assert_piped_matches_file(["generateDictionary", "-l", "9", "-c", "ab"])
+
+    def test_generate_combinatory(self):
+        self.assert_piped_matches_file(["generateCombinatory"])
+
+    def test_pipeline(self):
+        self.assert_piped_matches_file(["pipeline", "-l", "8", "-s", "?d", "-k"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+import os
+import subprocess
+import sys
+import unittest
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dictionaryGenerator.py")
+
+
+class PipelineOptionsTest(unittest.TestCase):
+    """Padding options of the pipeline command must be given together."""
+
+    def assert_rejected(self, args):
+        result = subprocess.run([sys.executable, SCRIPT, "pipeline", "-f", os.devnull, "-o", os.devnull] + args,
+                                capture_output=True, text=True)
+        self.assertEqual(result.returncode, 2)
+        self.assertIn("require", result.stderr)
+
+    def test_pad_length_without_charset(self):
+        self.assert_rejected(["-l", "8"])
+
+    def test_charset_without_pad_length(self):
+        self.assert_rejected(["-s", "?d"])
+
+    def test_prepend_without_pad_length(self):
+        self.assert_rejected(["-p"])
+
+
+if __name__ == "__main__":
+    unittest.main()